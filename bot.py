@@ -9,6 +9,8 @@ def main() -> None:
 
     container = Container()
     settings = Settings()
+    container.entries_repo().ensure_indexes()
+    container.watchlist_entries_repo().ensure_indexes()
 
     bot_app = BotApp(
         token=settings.telegram_bot_token,
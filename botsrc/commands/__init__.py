@@ -1,25 +0,0 @@
-from botsrc.commands._add import add
-from botsrc.commands._find import find
-from botsrc.commands._group import group
-from botsrc.commands._guest import guest
-from botsrc.commands._image import image
-from botsrc.commands._list import list_
-from botsrc.commands._pop import pop
-from botsrc.commands._suggest import suggest
-from botsrc.commands._tag import tag
-from botsrc.commands._watch import watch
-from botsrc.commands._upload import upload_photo
-
-__all__ = [
-    "add",
-    "suggest",
-    "tag",
-    "group",
-    "list_",
-    "find",
-    "watch",
-    "pop",
-    "guest",
-    "image",
-    "upload_photo",
-]
@@ -8,7 +8,10 @@ from src.applications.api.auth import (
     get_current_user,
     require_admin,
 )
-from src.applications.api.dependencies import get_entry_service
+from src.applications.api.dependencies import (
+    get_entry_service,
+    get_watchlist_service,
+)
 from src.applications.api.schemas import (
     EntryCreateRequest,
     EntryResponse,
@@ -16,6 +19,7 @@ from src.applications.api.schemas import (
 )
 from src.models.entry import Entry, EntryType
 from src.services.entry_service import EntryService
+from src.services.watchlist_service import WatchlistService
 
 from loguru import logger
 
@@ -73,6 +77,7 @@ def create_entry(
     req: EntryCreateRequest,
     _admin: AuthUser = Depends(require_admin),
     svc: EntryService = Depends(get_entry_service),
+    watchlist_svc: WatchlistService = Depends(get_watchlist_service),
 ) -> EntryResponse:
     logger.info(f"[{_admin}] Creating entry {req.title}")
     entry = Entry(
@@ -83,7 +88,7 @@ def create_entry(
         notes=req.notes,
     )
     created = svc.add_entry(entry)
-    svc.remove_from_watchlist_on_add(created)
+    watchlist_svc.discard(created.title, created.is_series)
     return _to_response(created)
 
 
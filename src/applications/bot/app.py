@@ -1,12 +1,14 @@
 """Telegram bot application using shared services."""
 
 from collections.abc import Callable
-from functools import wraps
+from functools import lru_cache, wraps
 
 from loguru import logger
+from requests import RequestException
 from telebot import TeleBot, types
+from telebot.apihelper import ApiException
 
-from src.applications.bot.commands import BotCommands
+from src.applications.bot.commands import COMMANDS, ME_CHAT_ID, BotCommands
 from src.parser import Flags, KeywordArgs, ParsingError, PositionalArgs, parse
 from src.services.entry_service import EntryService
 from src.services.guest_service import GuestService
@@ -14,9 +16,12 @@ from src.services.image_service import ImageService
 from src.services.watchlist_service import WatchlistService
 from src.utils.help_utils import parse_docstring
 
-ME_CHAT_ID = 409474295
+ALLOW_GUEST_COMMANDS = frozenset({"list", "watch", "suggest", "find", "tag", "group"})
+# commands that take long enough for a "typing..." indicator to be worth a request
+SLOW_COMMANDS = frozenset({"image", "group"})
 
-ALLOW_GUEST_COMMANDS = {"list", "watch", "suggest", "find", "tag", "group"}
+_OWNER_FLAGS: frozenset[str] = frozenset()
+_GUEST_FLAGS: frozenset[str] = frozenset({"guest"})
 
 HELP_GUEST_MESSAGE = """You can use the bot, but some commands may be restricted.
 You can use the following commands (read-only):
@@ -28,18 +33,16 @@ You can use the following commands (read-only):
     - tag [<tagname>] - to view tags stats or entries with the given tag"""
 
 
-def _get_help(
-    commands: dict[str, Callable[..., None]],
-    command: str | None = None,
-) -> str:
+@lru_cache(maxsize=64)
+def _get_help(command: str | None = None) -> str:
     if command is None:
         return "\n".join(
             f"/{cmd} - {parsed_doc[1]}\n  {parsed_doc[0]}"
             if (parsed_doc := parse_docstring(func.__doc__)) is not None
             else f"/{cmd}"
-            for cmd, func in commands.items()
+            for cmd, func in COMMANDS.items()
         )
-    func = commands.get(command)
+    func = COMMANDS.get(command)
     if func is None:
         return f"Command {command!r} not found."
     docstring = parse_docstring(func.__doc__)
@@ -57,9 +60,8 @@ class BotApp:
         guest_service: GuestService,
         image_service: ImageService,
     ) -> None:
-        self.bot = TeleBot(token)
+        self.bot = TeleBot(token, threaded=True, num_threads=8)
         self._guest_svc = guest_service
-        self._image_svc = image_service
 
         self._commands = BotCommands(
             entry_service=entry_service,
@@ -75,9 +77,8 @@ class BotApp:
                 None,
             ],
         ] = {
-            method_name[4:]: getattr(self._commands, method_name)
-            for method_name in dir(self._commands)
-            if method_name.startswith("cmd_")
+            name: getattr(self._commands, func.__name__)
+            for name, func in COMMANDS.items()
         }
 
         self._register_handlers()
@@ -87,24 +88,43 @@ class BotApp:
         def wrapper(message: types.Message) -> None:
             if message.from_user is None or message.from_user.username is None:
                 logger.error(
-                    f"Message without username: {message.chat.id=}; {message.text}"
+                    "Message without username: message.chat.id={}; {}",
+                    message.chat.id,
+                    message.text,
                 )
                 return
             username = message.from_user.username
-            name = message.from_user.first_name
-            logger.info(f"{name}(@{username};id={message.chat.id}):{message.text}")
+            # cheap membership checks first so rejected users cost no logging
             if message.chat.id == ME_CHAT_ID:
-                extra_flags: set[str] = set()
+                extra_flags = _OWNER_FLAGS
             elif self._guest_svc.is_guest(username):
-                extra_flags = {"guest"}
+                extra_flags = _GUEST_FLAGS
             else:
-                self.bot.reply_to(message, "You are not allowed to use this bot.")
-                logger.info(f"User {username} is not allowed to use the bot")
+                self.bot.send_message(
+                    message.chat.id, "You are not allowed to use this bot."
+                )
+                logger.info("User {} is not allowed to use the bot", username)
                 return
+            logger.info(
+                "{}(@{};id={}):{}",
+                message.from_user.first_name,
+                username,
+                message.chat.id,
+                message.text,
+            )
             func(message, extra_flags)
 
         return wrapper
 
+    def _send_chat_action(self, chat_id: int, action: str) -> None:
+        """Show a chat action; a failure is logged and never stops the command."""
+        try:
+            self.bot.send_chat_action(chat_id, action)
+        except (ApiException, RequestException):
+            logger.opt(exception=True).warning(
+                "failed to send chat action {!r}", action
+            )
+
     def _managed_help(
         self,
         root: str,
@@ -116,15 +136,15 @@ class BotApp:
             if "guest" in flags:
                 msg = HELP_GUEST_MESSAGE
             elif not pos:
-                msg = _get_help(self._command_map)
+                msg = _get_help()
             elif len(pos) == 1:
-                msg = _get_help(self._command_map, pos[0])
+                msg = _get_help(pos[0])
             else:
                 msg = "Too many arguments."
             self.bot.send_message(message.chat.id, msg)
             return True
         if "help" in flags:
-            msg = _get_help(self._command_map, root)
+            msg = _get_help(root)
             self.bot.send_message(message.chat.id, msg)
             return True
         return False
@@ -132,7 +152,7 @@ class BotApp:
     def _register_handlers(self) -> None:
         @self.bot.message_handler(commands=["start"])
         @self._pre_process
-        def cmd_start(message: types.Message, extra_flags: set[str]) -> None:
+        def cmd_start(message: types.Message, extra_flags: frozenset[str]) -> None:
             if "guest" in extra_flags:
                 self.bot.send_message(
                     message.chat.id,
@@ -144,28 +164,27 @@ class BotApp:
 
         @self.bot.message_handler(commands=["stop"])
         @self._pre_process
-        def cmd_stop(message: types.Message, extra_flags: set[str]) -> None:
+        def cmd_stop(message: types.Message, extra_flags: frozenset[str]) -> None:
             self.bot.send_message(message.chat.id, "Shutting down.")
             logger.info("Stopping bot via /stop")
             self.bot.stop_bot()
 
         @self.bot.message_handler(content_types=["photo"])
         @self._pre_process
-        def handle_photo(message: types.Message, extra_flags: set[str]) -> None:
-            from botsrc.commands._upload import upload_photo
-
-            upload_photo(message, self.bot, self._image_svc)
+        def handle_photo(message: types.Message, extra_flags: frozenset[str]) -> None:
+            self._send_chat_action(message.chat.id, "upload_photo")
+            self._commands.upload_photo(self.bot, message)
 
         @self.bot.message_handler(func=lambda msg: True)
         @self._pre_process
-        def handle_text(message: types.Message, extra_flags: set[str]) -> None:
+        def handle_text(message: types.Message, extra_flags: frozenset[str]) -> None:
             if message.text is None:
-                self.bot.reply_to(message, "Only text is supported.")
+                self.bot.send_message(message.chat.id, "Only text is supported.")
                 return
             try:
-                root, pos, kwargs, flags = parse(message.text.lstrip("/"))
+                root, pos, kwargs, flags = parse(message.text.removeprefix("/"))
             except ParsingError as e:
-                self.bot.reply_to(message, f"{e}: {message.text!r}")
+                self.bot.send_message(message.chat.id, f"{e}: {message.text!r}")
                 logger.info("parsing error", exc_info=True)
                 return
             root = root.lower()
@@ -175,21 +194,34 @@ class BotApp:
             command_method = self._command_map.get(root)
             if command_method is None:
                 msg = f"Unknown command: {message.text}"
-                self.bot.reply_to(message, msg)
+                self.bot.send_message(message.chat.id, msg)
                 logger.info(msg)
                 return
             if "guest" in flags and root not in ALLOW_GUEST_COMMANDS:
-                self.bot.reply_to(
-                    message,
+                self.bot.send_message(
+                    message.chat.id,
                     f"Sorry, you are not allowed to use {root}. "
                     "Type /help to see available commands.",
                 )
-                logger.info(f"guest: command {root} not allowed")
+                logger.info("guest: command {} not allowed", root)
                 return
-            logger.info(f"Called {root} with {pos=}, {kwargs=}, {flags=}")
+            logger.info(
+                "Called {} with pos={!r}, kwargs={!r}, flags={!r}",
+                root,
+                pos,
+                kwargs,
+                flags,
+            )
+            if root in SLOW_COMMANDS:
+                self._send_chat_action(message.chat.id, "typing")
             command_method(pos, kwargs, flags, self.bot, message)
 
     def run(self) -> None:
         logger.info("Bot started")
         self.bot.send_message(ME_CHAT_ID, "Bot started")
-        self.bot.infinity_polling()
+        self.bot.infinity_polling(
+            timeout=50,
+            long_polling_timeout=50,
+            skip_pending=True,
+            allowed_updates=["message"],
+        )
@@ -1,12 +1,17 @@
 """Bot command handlers using shared services."""
 
+from collections.abc import Callable, Iterable
 from datetime import datetime
+from itertools import chain
+from threading import local
 
+import requests
 import telebot
 from loguru import logger
-from telebot import types
+from telebot import apihelper, types
 
 from src.applications.bot.formatting import (
+    chunk_lines,
     format_entry,
     format_title,
     list_many_entries,
@@ -18,6 +23,7 @@ from src.exceptions import (
     MalformedEntryException,
 )
 from src.models.entry import Entry, EntryType
+from src.obj.image import S3Image
 from src.parser import Flags, KeywordArgs, PositionalArgs
 from src.services.entry_service import EntryService
 from src.services.guest_service import GuestService
@@ -25,32 +31,56 @@ from src.services.image_service import ImageService
 from src.services.watchlist_service import WatchlistService
 from src.utils.utils import replace_tag_alias
 
+ME_CHAT_ID = 409474295
+MAX_IMAGES = 10
+
+_GUEST_ONLY_FLAGS = frozenset({"guest"})
+
 
 def _text(message: types.Message) -> str:
     return message.text if message.text is not None else ""
 
 
-def _movie_type_kb() -> types.ReplyKeyboardMarkup:
-    kb = types.ReplyKeyboardMarkup(resize_keyboard=True, row_width=2)
-    kb.add(types.KeyboardButton("Movie"), types.KeyboardButton("Series"))
-    return kb
+def _send_lines(bot: telebot.TeleBot, chat_id: int, lines: Iterable[str]) -> None:
+    """Send lines in as few messages as Telegram's length limit allows."""
+    for chunk in chunk_lines(lines):
+        if chunk.strip():
+            bot.send_message(chat_id, chunk)
 
 
-def _confirmation_kb() -> types.ReplyKeyboardMarkup:
-    kb = types.ReplyKeyboardMarkup(resize_keyboard=True, row_width=2)
-    kb.add(types.KeyboardButton("Confirm"), types.KeyboardButton("Cancel"))
-    return kb
+def _telegram_file_url(bot: telebot.TeleBot, file_path: str) -> str:
+    """Download URL of a Telegram file, as built by `TeleBot.download_file`."""
+    url_fmt = apihelper.FILE_URL or "https://api.telegram.org/file/bot{0}/{1}"
+    return url_fmt.format(bot.token, file_path)
 
 
-def _skip_kb(extra_buttons: list[str] | None = None) -> types.ReplyKeyboardMarkup:
-    extra_buttons = extra_buttons or []
-    kb = types.ReplyKeyboardMarkup(
-        resize_keyboard=True, row_width=1 + len(extra_buttons)
-    )
-    kb.add(*(types.KeyboardButton(btn) for btn in ["Skip"] + extra_buttons))
+def _reply_kb(*buttons: str) -> types.ReplyKeyboardMarkup:
+    kb = types.ReplyKeyboardMarkup(resize_keyboard=True, row_width=len(buttons))
+    kb.add(*(types.KeyboardButton(btn) for btn in buttons))
     return kb
 
 
+# the markups are constant, so they are built once and shared by all chats
+_MOVIE_TYPE_KB = _reply_kb("Movie", "Series")
+_CONFIRMATION_KB = _reply_kb("Confirm", "Cancel")
+_SKIP_KB = _reply_kb("Skip")
+_SKIP_TODAY_KB = _reply_kb("Skip", "Today")
+_REMOVE_KB = types.ReplyKeyboardRemove()
+
+
+COMMANDS: dict[str, Callable[..., None]] = {}
+
+
+def command[F: Callable[..., None]](name: str) -> Callable[[F], F]:
+    """Register a `BotCommands` method as the handler for `/<name>`."""
+
+    def decorator(func: F) -> F:
+        COMMANDS[name] = func
+        return func
+
+    return decorator
+
+
 class BotCommands:
     """Bot command implementations backed by services."""
 
@@ -65,7 +95,19 @@ class BotCommands:
         self._watchlist_svc = watchlist_service
         self._guest_svc = guest_service
         self._image_svc = image_service
-
+        # one requests.Session per bot worker thread (TeleBot(threaded=True)):
+        # Session is not documented as thread-safe, and each worker still
+        # keeps its connection to Telegram's file server alive across downloads
+        self._http_local = local()
+
+    @property
+    def _http(self) -> requests.Session:
+        session: requests.Session | None = getattr(self._http_local, "session", None)
+        if session is None:
+            session = self._http_local.session = requests.Session()
+        return session
+
+    @command("list")
     def cmd_list(
         self,
         pos: PositionalArgs,
@@ -80,18 +122,18 @@ class BotCommands:
             oid(flag): show the mongoDB OIDs
         """
         if "guest" in flags:
-            flags = set()
-            logger.debug("guest message; set flags to set()")
-        entries = self._entry_svc.get_entries()
+            verbose = with_oid = False
+            logger.debug("guest message; ignoring flags")
+        else:
+            verbose, with_oid = "verbose" in flags, "oid" in flags
+        entries = self._entry_svc.get_latest_entries(5)
         msg = list_many_entries(
-            entries[-5:],
-            "verbose" in flags,
-            "oid" in flags,
-            override_title="Last 5 entries:",
+            entries, verbose, with_oid, override_title="Last 5 entries:"
         )
         bot.send_message(message.chat.id, msg)
         logger.debug(msg)
 
+    @command("find")
     def cmd_find(
         self,
         pos: PositionalArgs,
@@ -105,24 +147,27 @@ class BotCommands:
             verbose(flag): show the notes
             oid(flag): show the mongoDB OIDs
         """
-        if not pos:
+        # a blank title (e.g. /find "  ") would match every entry
+        title = " ".join(pos).strip()
+        if not title:
             bot.reply_to(message, "You must specify a title.")
             logger.debug("title not specified")
             return
         if "guest" in flags:
             logger.debug(f"guest user tried to use flags {flags}; prevented")
-            flags = set()
-        title = " ".join(pos)
-        entries = self._entry_svc.get_entries()
-        filtered = [ent for ent in entries if title.lower() in ent.title.lower()]
+            verbose = with_oid = False
+        else:
+            verbose, with_oid = "verbose" in flags, "oid" in flags
+        filtered = self._entry_svc.find_entries_by_title(title)
         if not filtered:
             bot.reply_to(message, f"No entries found with {title!r}.")
             logger.debug(f"no entries found with {title!r}")
             return
-        res = list_many_entries(filtered, "verbose" in flags, "oid" in flags)
+        res = list_many_entries(filtered, verbose, with_oid)
         bot.send_message(message.chat.id, res)
         logger.debug(f"found {len(filtered)} entries with {title!r}")
 
+    @command("watch")
     def cmd_watch(
         self,
         pos: PositionalArgs,
@@ -137,12 +182,12 @@ class BotCommands:
             title: the title of the entry; if ends with a '+', it is a series
             delete(flag): delete instead of adding
         """
-        if not (pos or kwargs or (flags - {"guest"})):
-            movies = self._watchlist_svc.movies
-            series = self._watchlist_svc.series
-            bot.send_message(
+        if not (pos or kwargs or not flags <= _GUEST_ONLY_FLAGS):
+            movies, series = self._watchlist_svc.get_movies_and_series()
+            _send_lines(
+                bot,
                 message.chat.id,
-                f"Movies: {', '.join(movies)}\n\nSeries: {', '.join(series)}",
+                (f"Movies: {', '.join(movies)}", "", f"Series: {', '.join(series)}"),
             )
             logger.debug("watch list requested")
             return
@@ -150,9 +195,10 @@ class BotCommands:
             bot.reply_to(message, "Sorry, you can't modify anything.")
             logger.debug("guest user tried to modify watch list; prevented")
             return
+        # one trailing "+" marks a series and only that "+" is removed ("C++" -> "C+")
         watch_title = " ".join(pos)
         is_series = watch_title.endswith("+")
-        title = watch_title.rstrip("+ ")
+        title = watch_title[:-1].rstrip() if is_series else watch_title.rstrip()
         title_fmt = format_title(title, is_series)
         if "delete" in flags:
             try:
@@ -173,6 +219,7 @@ class BotCommands:
         bot.send_message(message.chat.id, f"Added {title_fmt} to watch list.")
         logger.debug(f"added {title_fmt} to watch list")
 
+    @command("pop")
     def cmd_pop(
         self,
         pos: PositionalArgs,
@@ -189,13 +236,11 @@ class BotCommands:
             bot.reply_to(message, "You must specify an oid.")
             logger.debug("oid not specified")
             return
-        entries = self._entry_svc.get_entries()
-        selected = [e for e in entries if pos[0] in e.id]
-        if len(selected) != 1:
+        selected_entry = self._entry_svc.get_entry_by_id_part(pos[0])
+        if selected_entry is None:
             bot.reply_to(message, "Could not find a unique entry.")
             return
-        selected_entry = selected[0]
-        logger.debug(f"selected entry: {selected_entry}")
+        logger.debug("selected entry: {}", selected_entry)
         assert selected_entry.id
         try:
             self._entry_svc.delete_entry(selected_entry.id)
@@ -209,6 +254,7 @@ class BotCommands:
         )
         logger.debug(f"deleted entry with id={selected_entry.id}")
 
+    @command("tag")
     def cmd_tag(
         self,
         pos: PositionalArgs,
@@ -226,20 +272,23 @@ class BotCommands:
             verbose(flag): show the notes
             oid(flag): show the mongoDB OIDs
         """
-        tags = self._entry_svc.get_tags()
         if not pos:
-            msg = "Tags:\n" + "\n".join(
-                f"{len(entries):>3}   {tag:<18}"
-                for tag, entries in sorted(
-                    tags.items(), key=lambda x: len(x[1]), reverse=True
-                )
+            _send_lines(
+                bot,
+                message.chat.id,
+                chain(
+                    ["Tags:"],
+                    (
+                        f"{count:>3}   {tag:<18}"
+                        for tag, count in self._entry_svc.get_tag_counts()
+                    ),
+                ),
             )
-            bot.send_message(message.chat.id, msg)
             logger.debug("no positional arguments; listing all tags")
             return
         if len(pos) == 1:
             tag = replace_tag_alias(pos[0])
-            if (tag_entries := tags.get(tag)) is None:
+            if (tag_entries := self._entry_svc.get_entries_with_tag(tag)) is None:
                 bot.send_message(message.chat.id, f"Tag {tag} not found.")
                 logger.debug(f"tag {tag!r} not found")
                 return
@@ -257,13 +306,12 @@ class BotCommands:
         if len(pos) == 2 and "guest" not in flags:
             tag_name, oid = pos
             tag_name = replace_tag_alias(tag_name)
-            entries = self._entry_svc.get_entries()
-            entry = next((ent for ent in entries if oid in ent.id), None)
+            entry = self._entry_svc.get_entry_by_id_part(oid)
             if entry is None:
                 bot.reply_to(message, "Could not find an entry.")
                 logger.debug(f"could not find entry with oid {oid}")
                 return
-            if {"d", "delete"} & flags:
+            if "d" in flags or "delete" in flags:
                 if not self._entry_svc.remove_tag(entry, tag_name):
                     bot.reply_to(
                         message, f"The entry does not have the tag {tag_name}:"
@@ -284,6 +332,7 @@ class BotCommands:
         bot.reply_to(message, "Too many arguments.")
         logger.debug("too many positional arguments")
 
+    @command("group")
     def cmd_group(
         self,
         pos: PositionalArgs,
@@ -294,10 +343,7 @@ class BotCommands:
     ) -> None:
         """group [<title>]
         List entries grouped by title."""
-        groups = self._entry_svc.get_groups()
-        if pos:
-            title = " ".join(pos)
-            groups = [g for g in groups if title.lower() in g.title.lower()]
+        groups = self._entry_svc.find_groups(" ".join(pos) if pos else None)
         if not groups:
             bot.send_message(message.chat.id, "No groups found.")
             logger.info("no groups found")
@@ -306,6 +352,7 @@ class BotCommands:
         bot.send_message(message.chat.id, msg)
         logger.info(f"found {len(groups)} groups")
 
+    @command("guest")
     def cmd_guest(
         self,
         pos: PositionalArgs,
@@ -333,8 +380,11 @@ class BotCommands:
         else:
             msg = "Guests: " + ", ".join(self._guest_svc.get_guests())
         bot.send_message(message.chat.id, msg)
-        logger.debug(f"{msg}; (current guests: {self._guest_svc.get_guests()})")
+        logger.opt(lazy=True).debug(
+            "{}; (current guests: {})", lambda: msg, self._guest_svc.get_guests
+        )
 
+    @command("add")
     def cmd_add(
         self,
         pos: PositionalArgs,
@@ -376,12 +426,11 @@ class BotCommands:
             return
         entry = Entry(title=title, rating=rating, date=date, type=type_, notes=notes)
         self._entry_svc.add_entry(entry)
-        bot.send_message(
-            message.chat.id,
-            f"Entry added:\n{format_entry(entry, True, True)}",
-        )
-        logger.debug(f"added entry {entry}")
-        self._process_watchlist_on_add(entry, bot, message)
+        logger.debug("added entry {}", entry)
+        parts = [f"Entry added:\n{format_entry(entry, True, True)}"]
+        if msg := self._process_watchlist_on_add(entry):
+            parts.append(msg)
+        bot.send_message(message.chat.id, "\n\n".join(parts))
 
     def _add_get_title(self, message: types.Message, bot: telebot.TeleBot) -> None:
         title = _text(message)
@@ -389,7 +438,7 @@ class BotCommands:
             bot.reply_to(
                 message,
                 "You must specify a title.",
-                reply_markup=types.ReplyKeyboardRemove(),
+                reply_markup=_REMOVE_KB,
             )
             return
         is_series = self._watchlist_svc.get_is_series(title)
@@ -416,13 +465,13 @@ class BotCommands:
             bot.reply_to(
                 message,
                 str(e),
-                reply_markup=types.ReplyKeyboardRemove(),
+                reply_markup=_REMOVE_KB,
             )
             return
         bot.send_message(
             message.chat.id,
             "What type of entry is it? (Movie or Series)",
-            reply_markup=_movie_type_kb(),
+            reply_markup=_MOVIE_TYPE_KB,
         )
         bot.register_next_step_handler_by_chat_id(
             message.chat.id,
@@ -445,13 +494,13 @@ class BotCommands:
             bot.send_message(
                 message.chat.id,
                 str(e),
-                reply_markup=types.ReplyKeyboardRemove(),
+                reply_markup=_REMOVE_KB,
             )
             return
         bot.send_message(
             message.chat.id,
             "Please enter the date (dd.mm.yyyy or 'today' or nothing):",
-            reply_markup=_skip_kb(extra_buttons=["Today"]),
+            reply_markup=_SKIP_TODAY_KB,
         )
         bot.register_next_step_handler_by_chat_id(
             message.chat.id,
@@ -477,13 +526,13 @@ class BotCommands:
             bot.reply_to(
                 message,
                 f"Invalid date: {e}. Please use the format dd.mm.yyyy or 'today'.",
-                reply_markup=types.ReplyKeyboardRemove(),
+                reply_markup=_REMOVE_KB,
             )
             return
         bot.send_message(
             message.chat.id,
             "Do you want to add any notes? (Optional):",
-            reply_markup=_skip_kb(),
+            reply_markup=_SKIP_KB,
         )
         bot.register_next_step_handler_by_chat_id(
             message.chat.id,
@@ -504,12 +553,14 @@ class BotCommands:
         type_: EntryType,
         date: datetime | None,
     ) -> None:
-        notes = _text(message) if _text(message).lower() != "skip" else ""
+        notes = _text(message)
+        if notes.lower() == "skip":
+            notes = ""
         entry = Entry(title=title, rating=rating, date=date, type=type_, notes=notes)
         bot.send_message(
             message.chat.id,
             f"Thank you! Let's confirm the details:\n{format_entry(entry, True)}",
-            reply_markup=_confirmation_kb(),
+            reply_markup=_CONFIRMATION_KB,
         )
         bot.register_next_step_handler_by_chat_id(
             message.chat.id,
@@ -525,47 +576,40 @@ class BotCommands:
             bot.send_message(
                 message.chat.id,
                 "Entry creation canceled.",
-                reply_markup=types.ReplyKeyboardRemove(),
+                reply_markup=_REMOVE_KB,
             )
             logger.debug("entry creation canceled")
             return
         self._entry_svc.add_entry(entry)
+        logger.debug("added entry {}", entry)
+        # one reply instead of up to three separate messages
+        parts = [f"Entry added:\n{format_entry(entry, True, True)}"]
+        if msg := self._process_watchlist_on_add(entry):
+            parts.append(msg)
+        if msg := self._process_watch_again_on_add(entry):
+            parts.append(msg)
         bot.send_message(
             message.chat.id,
-            f"Entry added:\n{format_entry(entry, True, True)}",
-            reply_markup=types.ReplyKeyboardRemove(),
+            "\n\n".join(parts),
+            reply_markup=_REMOVE_KB,
         )
-        logger.debug(f"added entry {entry}")
-        self._process_watchlist_on_add(entry, bot, message)
-        self._process_watch_again_on_add(entry, bot, message)
 
-    def _process_watchlist_on_add(
-        self,
-        entry: Entry,
-        bot: telebot.TeleBot,
-        message: types.Message,
-    ) -> None:
-        title_fmt = format_title(entry.title, entry.is_series)
-        if self._entry_svc.remove_from_watchlist_on_add(entry):
-            bot.send_message(
-                message.chat.id,
-                f"Removed {title_fmt} from watch list.",
-            )
+    def _process_watchlist_on_add(self, entry: Entry) -> str | None:
+        """Remove the new entry from the watch list; returns the message to show."""
+        if not self._watchlist_svc.discard(entry.title, entry.is_series):
+            return None
+        return f"Removed {format_title(entry.title, entry.is_series)} from watch list."
 
-    def _process_watch_again_on_add(
-        self,
-        entry: Entry,
-        bot: telebot.TeleBot,
-        message: types.Message,
-    ) -> None:
+    def _process_watch_again_on_add(self, entry: Entry) -> str | None:
+        """Clear older watch-again tags; returns the message to show."""
         modified = self._entry_svc.process_watch_again_on_add(entry)
         if not modified:
-            return
-        msg = "Removed the watch again tag from:"
-        for ent in modified:
-            msg += f"\n{format_entry(ent)}"
-        bot.send_message(message.chat.id, msg)
+            return None
+        return "Removed the watch again tag from:\n" + "\n".join(
+            [format_entry(ent) for ent in modified]
+        )
 
+    @command("suggest")
     def cmd_suggest(
         self,
         pos: PositionalArgs,
@@ -576,9 +620,7 @@ class BotCommands:
     ) -> None:
         """suggest <message>
         Suggest a movie to the owner."""
-        from botsrc.utils import ME_CHAT_ID
-
-        if message.text is None or not message.text.strip():
+        if not message.text or message.text.isspace():
             bot.reply_to(message, "Please provide a text message.")
             logger.debug("empty message text")
             return
@@ -589,6 +631,7 @@ class BotCommands:
         bot.send_message(message.chat.id, "Thank you for your suggestion!")
         logger.debug(sugg_text)
 
+    @command("image")
     def cmd_image(
         self,
         pos: PositionalArgs,
@@ -603,6 +646,93 @@ class BotCommands:
             list <filter> [--show]: List images by filter; show if --show is specified
             entry <entry_oid>: Show images for a specific entry
         """
-        from botsrc.commands._image import image
+        match pos:
+            case ["list", filter]:
+                imgs = self._image_svc.create_manager().get_images(filter)
+                logger.debug(f"found {len(imgs)} images matching {filter!r}")
+                if not imgs:
+                    bot.send_message(
+                        message.chat.id, f"No images found matching {filter!r}"
+                    )
+                    return
+                header = f"Found {len(imgs)} images matching {filter!r}:\n"
+                if len(imgs) > MAX_IMAGES:
+                    imgs = imgs[-MAX_IMAGES:]
+                    header += f"(last {MAX_IMAGES})\n"
+                if "show" in flags:
+                    logger.debug(f"showing images for {filter!r}")
+                    photo_group = self._media_group(
+                        imgs, caption=f"{len(imgs)} images matching {filter!r}"
+                    )
+                    bot.send_media_group(message.chat.id, photo_group)  # type: ignore
+                else:
+                    msg = header + "\n".join(map(str, imgs))
+                    bot.send_message(message.chat.id, msg)
+            case ["entry", entry_oid]:
+                logger.debug(f"fetching images for entry matching {entry_oid=!r}")
+                selected_entry = self._entry_svc.get_entry_by_id_part(entry_oid)
+                if not selected_entry:
+                    bot.send_message(
+                        message.chat.id, f"No entry found matching {entry_oid!r}"
+                    )
+                    logger.debug(f"no entry found matching {entry_oid!r}")
+                    return
+                imgs = [S3Image(s3_id=img_id) for img_id in selected_entry.image_ids]
+                if not imgs:
+                    bot.send_message(
+                        message.chat.id, f"No images found for {selected_entry}"
+                    )
+                    logger.debug("no images found for {}", selected_entry)
+                    return
+                if len(imgs) > MAX_IMAGES:
+                    logger.debug(f"limiting images to last {MAX_IMAGES}")
+                    imgs = imgs[-MAX_IMAGES:]
+                photo_group = self._media_group(
+                    imgs, caption=f"Images of {selected_entry}"
+                )
+                bot.send_media_group(message.chat.id, photo_group)  # type: ignore
+            case _:
+                bot.send_message(message.chat.id, "Invalid image command.")
+                logger.debug(
+                    f"invalid image command with pos={pos}, flags={flags}, "
+                    f"kwargs={kwargs}"
+                )
 
-        image(message, bot, pos, flags, kwargs, image_service=self._image_svc)
+    def _media_group(
+        self, images: list[S3Image], caption: str | None = None
+    ) -> list[types.InputMediaPhoto]:
+        return [
+            types.InputMediaPhoto(
+                self._image_svc.generate_presigned_url(img, expires_in_sec=10),
+                caption=caption if i == 0 else None,
+            )
+            for i, img in enumerate(images)
+        ]
+
+    def upload_photo(self, bot: telebot.TeleBot, message: types.Message) -> None:
+        """Upload the largest size of a received photo to S3."""
+        photo_id = message.photo[-1].file_id if message.photo else "no_photo"
+        photo_info = bot.get_file(photo_id)
+        if photo_info is None:
+            logger.error(f"Failed to get file info for photo_id: {photo_id}")
+            bot.reply_to(message, "Failed to get photo info.")
+            return
+        if photo_info.file_path is None:
+            logger.error(f"File path is None for photo_id: {photo_id}")
+            bot.reply_to(message, "Failed to get photo file path.")
+            return
+        logger.debug(
+            "Photo received; photo_id={!r}, photo_info={!r}", photo_id, photo_info
+        )
+        # pipe the download into S3 rather than holding the whole file in memory
+        with self._http.get(
+            _telegram_file_url(bot, photo_info.file_path),
+            stream=True,
+            proxies=apihelper.proxy,
+            timeout=(apihelper.CONNECT_TIMEOUT, apihelper.READ_TIMEOUT),
+        ) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            s3_img = self._image_svc.upload_image_fileobj(response.raw)
+        bot.reply_to(message, f"Photo uploaded with id: {s3_img.id}")
+        logger.debug("Photo uploaded; s3_img={!r}", s3_img)
@@ -1,6 +1,6 @@
 """Bot-specific formatting utilities (plain text for Telegram)."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from typing import TypeVar
 
 from src.models.entry import Entry
@@ -8,6 +8,8 @@ from src.models.entry_group import EntryGroup
 
 ObjectT = TypeVar("ObjectT")
 
+TELEGRAM_MESSAGE_LIMIT = 4096
+
 
 def format_title(title: str, is_series: bool) -> str:
     return f"{title}{' (series)' if is_series else ''}"
@@ -37,7 +39,7 @@ def list_many(
 ) -> str:
     n = min(7, len(objects))
     _s = slice(None, n, None) if first_n else slice(-n, None, None)
-    data = "\n".join(format_fn(obj, **kwargs) for obj in objects[_s])
+    data = "\n".join([format_fn(obj, **kwargs) for obj in objects[_s]])
     return (
         (f"{len(objects)} found:" if override_title is None else override_title)
         + "\n"
@@ -73,3 +75,28 @@ def list_many_groups(
         first_n=True,
         override_title=override_title,
     )
+
+
+def chunk_lines(
+    lines: Iterable[str], limit: int = TELEGRAM_MESSAGE_LIMIT
+) -> Iterator[str]:
+    """Join lines into messages of at most `limit` characters each.
+
+    Lines are only split when a single line is longer than `limit`.
+    """
+    buf: list[str] = []
+    size = 0
+    for line in lines:
+        while len(line) > limit:
+            if buf:
+                yield "\n".join(buf)
+                buf, size = [], 0
+            yield line[:limit]
+            line = line[limit:]
+        if buf and size + 1 + len(line) > limit:
+            yield "\n".join(buf)
+            buf, size = [], 0
+        size += len(line) + (1 if buf else 0)
+        buf.append(line)
+    if buf:
+        yield "\n".join(buf)
@@ -194,8 +194,9 @@ class TUIApp(BaseApp):
             return
         exact = self._entry_svc.find_exact_matches(title)
         sub = self._entry_svc.find_substring_matches(title)
+        needle = title.casefold()
         watch = self._watchlist_svc.filter_items(
-            key=lambda t, _: title.lower() in t.lower()
+            key=lambda t, _: needle in t.casefold()
         )
         if exact:
             ids, matches = zip(*exact)
@@ -565,7 +566,8 @@ class TUIApp(BaseApp):
         elif F_MOVIES in flags:
             groups = [g for g in groups if g.type == EntryType.MOVIE]
         if title := " ".join(pos):
-            groups = [g for g in groups if title.lower() in g.title.lower()]
+            needle = title.casefold()
+            groups = [g for g in groups if needle in g.title.casefold()]
         _title = f"Top {n} groups" + (f' with "{title}"' if title else "")
         _slice = slice(0, None, None) if F_ALL in flags else slice(0, n, None)
         if not groups[_slice]:
@@ -847,7 +849,7 @@ class TUIApp(BaseApp):
         self._process_watch_again_tag_on_add(entry)
         self._entry_svc.add_entry(entry)
         self.cns.print(f"[green] Added [/]\n{format_entry(entry)}")
-        removed = self._entry_svc.remove_from_watchlist_on_add(entry)
+        removed = self._watchlist_svc.discard(entry.title, entry.is_series)
         if removed:
             self.cns.print(
                 "[green]󰺝 Removed from watch list[/]: "
@@ -1,6 +1,7 @@
 from typing import cast
 
 import boto3
+from botocore.config import Config as BotocoreConfig
 from dependency_injector.containers import DeclarativeContainer
 from dependency_injector.providers import Callable, Configuration, Singleton
 from pymongo.mongo_client import MongoClient
@@ -22,6 +23,13 @@ from src.services.image_service import ImageService
 from src.services.watchlist_service import WatchlistService
 from src.settings import Settings
 
+# room for the 16 concurrent tag fetches in `ImageManager` and the 10
+# multipart upload workers without recycling pooled connections
+S3_CLIENT_CONFIG = BotocoreConfig(
+    max_pool_connections=20,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
 
 def build_mongo_uri(prefix: str, password: str, suffix: str) -> str:
     return f"{prefix}:{password}@{suffix}"
@@ -42,6 +50,12 @@ class Container(DeclarativeContainer):
         MongoClient,
         mongo_uri(),
         server_api=ServerApi("1"),
+        maxPoolSize=20,
+        minPoolSize=2,
+        serverSelectionTimeoutMS=5_000,
+        socketTimeoutMS=20_000,
+        retryWrites=True,
+        compressors="zlib",
     )
 
     entries_repo = Singleton(
@@ -70,6 +84,7 @@ class Container(DeclarativeContainer):
         EntryService,
         entries_repo=entries_repo,
         watchlist_repo=watchlist_entries_repo,
+        cache_ttl_sec=config.entries_cache_ttl_sec,
     )
     watchlist_service = Singleton(
         WatchlistService,
@@ -97,6 +112,7 @@ class Container(DeclarativeContainer):
         region_name="eu-north-1",
         aws_access_key_id=config.aws_access_key_id,
         aws_secret_access_key=config.aws_secret_access_key,
+        config=S3_CLIENT_CONFIG,
     )
     image_service = Singleton(
         ImageService,
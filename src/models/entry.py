@@ -1,4 +1,5 @@
 from collections import defaultdict
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from enum import StrEnum
 from typing import Any, Self
@@ -97,6 +98,11 @@ class Entry(EntryBaseModel):
         _date = self.date.astimezone(LOCAL_TZ)
         return _date.strftime("%Y-%m-%d %H:%M:%S")
 
+    @property
+    def title_casefold(self) -> str:
+        """Case-folded title for case-insensitive matching."""
+        return self.title.casefold()
+
     @property
     def is_series(self) -> bool:
         return self.type == EntryType.SERIES
@@ -211,7 +217,7 @@ class Entry(EntryBaseModel):
             raise MalformedEntryException(f"Unknown type: {type_str}")
 
 
-def build_tags(entries: list[Entry]) -> defaultdict[str, list[Entry]]:
+def build_tags(entries: Iterable[Entry]) -> defaultdict[str, list[Entry]]:
     """Group entries by their tags."""
     tags: defaultdict[str, list[Entry]] = defaultdict(list)
     for entry in entries:
@@ -1,6 +1,7 @@
 """Derived (title, type) groups over `Entry` rows — not stored in MongoDB."""
 
 from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from datetime import UTC, datetime, timedelta
 from statistics import mean
 from typing import Self
@@ -65,7 +66,7 @@ class EntryGroup(BaseModel):
         return f"{self.ratings}{mean_str} {self.title}{from_str}"
 
 
-def groups_from_list_of_entries(entries: list[Entry]) -> list[EntryGroup]:
+def groups_from_list_of_entries(entries: Iterable[Entry]) -> list[EntryGroup]:
     grouped: defaultdict[tuple[str, EntryType], list[Entry]] = defaultdict(list)
     for entry in entries:
         grouped[(entry.title, entry.type)].append(entry)
@@ -76,7 +77,7 @@ def groups_from_list_of_entries(entries: list[Entry]) -> list[EntryGroup]:
     )
 
 
-def partition_by_title_group(entries: list[Entry]) -> list[list[Entry]]:
+def partition_by_title_group(entries: Iterable[Entry]) -> list[list[Entry]]:
     """Split entries into disjoint lists, one per (title, type) group."""
     grouped: defaultdict[tuple[str, EntryType], list[Entry]] = defaultdict(list)
     for entry in entries:
@@ -98,7 +99,7 @@ def last_watched_entry(entries: list[Entry]) -> Entry:
 
 
 def review_eligible_groups(
-    entries: list[Entry],
+    entries: Sequence[Entry],
     *,
     min_age_days: int = REVIEW_MIN_AGE_DAYS,
 ) -> list[tuple[EntryGroup, Entry, int]]:
@@ -107,6 +108,9 @@ def review_eligible_groups(
     Entries without a date are treated as infinitely old (always eligible).
     """
     cutoff = datetime.now(UTC) - timedelta(days=min_age_days)
+    index_by_id: dict[str, int] = {}
+    for i, e in enumerate(entries):
+        index_by_id.setdefault(e.id, i)
     out: list[tuple[EntryGroup, Entry, int]] = []
     for group_entries in partition_by_title_group(entries):
         last = last_watched_entry(group_entries)
@@ -115,6 +119,5 @@ def review_eligible_groups(
         if last.date is not None and _utc_for_cmp(last.date) >= cutoff:
             continue
         eg = EntryGroup.from_list_of_entries(list(group_entries))
-        idx = next(i for i, e in enumerate(entries) if e.id == last.id)
-        out.append((eg, last, idx))
+        out.append((eg, last, index_by_id[last.id]))
     return out
@@ -1,11 +1,106 @@
+import re
+from datetime import UTC, datetime
 from typing import Any
 
-from src.models.entry import Entry
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from src.models.entry import Entry, EntryType
+from src.models.entry_group import MIN_DT, EntryGroup
 from src.repos.mongo_base import MongoRepo
+from src.utils.utils import parse_date
+
+
+def _stored_date(value: Any) -> datetime | None:
+    """A stored entry date as `Entry` reads it; None if missing or unparsable."""
+    if isinstance(value, datetime):
+        return value.astimezone(UTC)
+    if isinstance(value, str):
+        return parse_date(value)
+    return None
 
 
 class EntriesRepo(MongoRepo[Entry]):
     collection_name = "entries"
+    indexes = (
+        # /find and /group: the title regex scans index keys instead of documents
+        IndexModel([("title", ASCENDING)]),
+        # queries filtering on a tag: multikey index over the tags array
+        IndexModel([("tags", ASCENDING)]),
+        # no date index: dates are strings in mixed formats, so a sort on them
+        # does not give the entry order; /list reads the cached snapshot instead
+    )
 
     def _serialize(self, entry: Entry) -> dict[str, Any]:
         return entry.to_mongo_dict()
+
+    def find_by_title_substring(self, substring: str) -> list[Entry]:
+        """Return entries whose title contains `substring`, ignoring case."""
+        cursor = self.collection.find(
+            {"title": {"$regex": re.escape(substring), "$options": "i"}}
+        ).batch_size(50)
+        return [self._deserialize(doc) for doc in cursor]
+
+    def find_by_title_and_tag(self, title: str, tag: str) -> list[Entry]:
+        """Return entries with exactly this title that carry `tag`."""
+        cursor = self.collection.find({"title": title, "tags": tag})
+        return [self._deserialize(doc) for doc in cursor]
+
+    def get_groups(self, title_substring: str | None = None) -> list[EntryGroup]:
+        """Group entries by (title, type) in MongoDB, best mean rating first.
+
+        Ratings within a group are ordered by date, as in
+        `EntryGroup.from_list_of_entries`.
+        """
+        pipeline: list[dict[str, Any]] = []
+        if title_substring is not None:
+            pipeline.append(
+                {
+                    "$match": {
+                        "title": {
+                            "$regex": re.escape(title_substring),
+                            "$options": "i",
+                        }
+                    }
+                }
+            )
+        pipeline += [
+            {
+                "$group": {
+                    "_id": {
+                        # titles are stripped when loaded into `Entry`; legacy
+                        # rows may still carry stray whitespace
+                        "title": {"$trim": {"input": "$title"}},
+                        # the default type is not stored (see `Entry.to_mongo_dict`)
+                        "type": {
+                            "$toUpper": {"$ifNull": ["$type", EntryType.MOVIE.value]}
+                        },
+                    },
+                    "watches": {
+                        "$push": {
+                            "rating": "$rating",
+                            "date": {"$ifNull": ["$date", None]},
+                        }
+                    },
+                    "mean_rating": {"$avg": "$rating"},
+                }
+            },
+            {"$sort": {"mean_rating": DESCENDING, "_id.title": ASCENDING}},
+        ]
+        groups: list[EntryGroup] = []
+        for doc in self.collection.aggregate(pipeline, allowDiskUse=True):
+            # dates are stored as strings, possibly in legacy formats, so they
+            # are parsed and ordered here rather than compared in MongoDB
+            watches = sorted(
+                ((_stored_date(w.get("date")), w["rating"]) for w in doc["watches"]),
+                key=lambda w: w[0] or MIN_DT,
+            )
+            dates = [date for date, _ in watches if date is not None]
+            groups.append(
+                EntryGroup(
+                    title=doc["_id"]["title"],
+                    type=doc["_id"]["type"],
+                    ratings=[rating for _, rating in watches],
+                    watched_last=max(dates) if dates else None,
+                )
+            )
+        return groups
@@ -1,6 +1,9 @@
+import re
+from collections.abc import Iterator
 from typing import Any
 
 from bson import ObjectId
+from pymongo import IndexModel, ReplaceOne
 from pymongo.collection import Collection
 from pymongo.mongo_client import MongoClient
 
@@ -12,6 +15,7 @@ class MongoRepo[EntryT: EntryBaseModel]:
     """Generic MongoDB repository with CRUD operations."""
 
     collection_name: str
+    indexes: tuple[IndexModel, ...] = ()
 
     def __init__(self, client: MongoClient, model_cls: type[EntryT]) -> None:
         self._client = client
@@ -21,6 +25,11 @@ class MongoRepo[EntryT: EntryBaseModel]:
     def collection(self) -> Collection:
         return self._client.db[self.collection_name]
 
+    def ensure_indexes(self) -> None:
+        """Create the collection's `indexes`; a no-op for ones that already exist."""
+        if self.indexes:
+            self.collection.create_indexes(list(self.indexes))
+
     def _serialize(self, entry: EntryT) -> dict[str, Any]:
         """Serialize model to dict for MongoDB storage.
 
@@ -46,13 +55,55 @@ class MongoRepo[EntryT: EntryBaseModel]:
         return self._deserialize(data)
 
     def get_all(self) -> list[EntryT]:
-        return [self._deserialize(doc) for doc in self.collection.find()]
+        return list(self.iter_all())
+
+    def iter_all(self) -> Iterator[EntryT]:
+        """Yield every document as it arrives from the cursor."""
+        for doc in self.collection.find():
+            yield self._deserialize(doc)
 
     def update(self, entry: EntryT) -> None:
         if not entry.id:
             raise ValueError("Cannot update entry without an id")
         self.collection.replace_one({"_id": ObjectId(entry.id)}, self._serialize(entry))
 
+    def update_many(self, entries: list[EntryT]) -> None:
+        """Replace several documents in a single bulk write."""
+        if not entries:
+            return
+        if not all(entry.id for entry in entries):
+            raise ValueError("Cannot update entry without an id")
+        self.collection.bulk_write(
+            [
+                ReplaceOne({"_id": ObjectId(entry.id)}, self._serialize(entry))
+                for entry in entries
+            ],
+            ordered=False,
+        )
+
+    def find_by_id_part(
+        self,
+        id_part: str,
+        limit: int = 0,
+        projection: dict[str, int] | None = None,
+    ) -> list[EntryT]:
+        """Return documents whose hex id contains `id_part` (at most `limit`)."""
+        query: dict[str, Any]
+        if ObjectId.is_valid(id_part):
+            # a full id can only match itself; use the _id index
+            query = {"_id": ObjectId(id_part)}
+        else:
+            query = {
+                "$expr": {
+                    "$regexMatch": {
+                        "input": {"$toString": "$_id"},
+                        "regex": re.escape(id_part),
+                    }
+                }
+            }
+        cursor = self.collection.find(query, projection=projection).limit(limit)
+        return [self._deserialize(doc) for doc in cursor]
+
     def delete(self, id: str | ObjectId) -> bool:
         oid = ObjectId(id) if isinstance(id, str) else id
         return self.collection.delete_one({"_id": oid}).deleted_count == 1
@@ -1,13 +1,36 @@
+from pymongo import ASCENDING, IndexModel
+
 from src.models.watchlist_entry import WatchlistEntry
 from src.repos.mongo_base import MongoRepo
 
 
 class WatchlistEntriesRepo(MongoRepo[WatchlistEntry]):
     collection_name = "watchlist"
+    indexes = (IndexModel([("title", ASCENDING), ("is_series", ASCENDING)]),)
 
     def add_by_title(self, title: str, is_series: bool) -> WatchlistEntry:
         entry = WatchlistEntry(title=title, is_series=is_series)
         return self.add(entry)
 
+    def add_by_title_if_absent(
+        self, title: str, is_series: bool
+    ) -> WatchlistEntry | None:
+        """Insert the entry unless it exists, in one round-trip.
+
+        Returns the new entry, or None if it was already present.
+        """
+        entry = WatchlistEntry(title=title, is_series=is_series)
+        doc = self._serialize(entry)
+        result = self.collection.update_one(doc, {"$setOnInsert": doc}, upsert=True)
+        if result.upserted_id is None:
+            return None
+        entry.id = str(result.upserted_id)
+        return entry
+
+    def get_is_series(self, title: str) -> bool | None:
+        """Return is_series of the entry with this title, or None if absent."""
+        doc = self.collection.find_one({"title": title}, {"is_series": 1})
+        return None if doc is None else doc["is_series"]
+
     def delete_by_title(self, title: str, is_series: bool) -> bool:
         return self.delete_by(title=title, is_series=is_series)
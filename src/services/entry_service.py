@@ -1,7 +1,12 @@
 import random
+from bisect import insort
 from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
+from functools import cached_property
 from statistics import mean
+from threading import Lock
+from time import monotonic
 
 from src.exceptions import EntryNotFoundException
 from src.models.entry import Entry, build_tags
@@ -16,6 +21,8 @@ from src.repos.entries import EntriesRepo
 from src.repos.watchlist_entries import WatchlistEntriesRepo
 from src.utils.utils import TAG_WATCH_AGAIN, possible_match, replace_tag_alias
 
+ENTRIES_CACHE_TTL_SEC = 30.0
+
 
 @dataclass
 class StatsResult:
@@ -41,6 +48,49 @@ class ReviewStats:
     avg_review_rating: float | None
 
 
+def _copy(entry: Entry) -> Entry:
+    return entry.model_copy(deep=True)
+
+
+@dataclass
+class _EntriesSnapshot:
+    """Sorted entries loaded at one point in time.
+
+    The snapshot is shared between readers, so its entries are never handed
+    out or mutated: public methods return copies, and writes store copies.
+    """
+
+    entries: tuple[Entry, ...]
+    expires_at: float
+
+    @cached_property
+    def titles_casefold(self) -> tuple[str, ...]:
+        """Case-folded titles, parallel to `entries`."""
+        return tuple(e.title_casefold for e in self.entries)
+
+    @cached_property
+    def titles(self) -> frozenset[str]:
+        return frozenset(e.title for e in self.entries)
+
+    @cached_property
+    def tags(self) -> defaultdict[str, list[Entry]]:
+        return build_tags(self.entries)
+
+    @cached_property
+    def tag_counts(self) -> tuple[tuple[str, int], ...]:
+        counts = ((tag, len(entries)) for tag, entries in self.tags.items())
+        return tuple(sorted(counts, key=lambda x: x[1], reverse=True))
+
+    def patched(
+        self, removed_ids: set[str], added: Iterable[Entry] = ()
+    ) -> "_EntriesSnapshot":
+        """A copy without `removed_ids` and with `added` inserted in sort order."""
+        entries = [e for e in self.entries if e.id not in removed_ids]
+        for entry in added:
+            insort(entries, entry)
+        return _EntriesSnapshot(entries=tuple(entries), expires_at=self.expires_at)
+
+
 class EntryService:
     """Business logic for movie/series entries."""
 
@@ -48,67 +98,165 @@ class EntryService:
         self,
         entries_repo: EntriesRepo,
         watchlist_repo: WatchlistEntriesRepo,
+        cache_ttl_sec: float = ENTRIES_CACHE_TTL_SEC,
     ) -> None:
         self._entries_repo = entries_repo
         self._watchlist_repo = watchlist_repo
+        self._cache_ttl_sec = cache_ttl_sec
+        self._entries_lock = Lock()
+        self._entries_version = 0
+        self._snapshot: _EntriesSnapshot | None = None
+
+    def _get_snapshot(self) -> _EntriesSnapshot:
+        """The cached sorted entries, reloaded when missing or expired.
+
+        Writes through this service patch the snapshot in place of a reload
+        (see `_patch_entries`); it still expires after `cache_ttl_sec` since
+        other processes may write to the same collection.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and monotonic() < snapshot.expires_at:
+            return snapshot
+        version = self._entries_version
+        snapshot = _EntriesSnapshot(
+            entries=tuple(sorted(self._entries_repo.iter_all())),
+            expires_at=monotonic() + self._cache_ttl_sec,
+        )
+        with self._entries_lock:
+            # a write that raced with the load may not be reflected in it
+            if version == self._entries_version:
+                self._snapshot = snapshot
+        return snapshot
+
+    def _patch_entries(
+        self, removed_ids: set[str], added: Iterable[Entry] = ()
+    ) -> None:
+        """Apply a write that already reached MongoDB to the cached snapshot.
+
+        Bumping the version keeps a load that raced with the write from being
+        stored; the derived tag index is rebuilt lazily from memory.
+        """
+        with self._entries_lock:
+            self._entries_version += 1
+            if self._snapshot is not None:
+                self._snapshot = self._snapshot.patched(
+                    removed_ids, [_copy(e) for e in added]
+                )
+
+    def _entries(self) -> tuple[Entry, ...]:
+        """Sorted entries for read-only use inside the service, without a copy."""
+        return self._get_snapshot().entries
 
     def get_entries(self) -> list[Entry]:
-        """Return all entries sorted by date."""
-        return sorted(self._entries_repo.get_all())
+        """Return all entries sorted by date, as copies safe to modify."""
+        return [_copy(e) for e in self._entries()]
+
+    def get_latest_entries(self, n: int) -> list[Entry]:
+        """Return the last `n` entries sorted by date, as `get_entries()[-n:]`.
+
+        Served from the snapshot: stored dates are strings in mixed formats and
+        `Entry` ordering breaks ties on fields like the notes, so MongoDB cannot
+        reproduce this order with a sort on `date`.
+        """
+        return [_copy(e) for e in self._entries()[-n:]] if n > 0 else []
 
     def add_entry(self, entry: Entry) -> Entry:
-        return self._entries_repo.add(entry)
+        added = self._entries_repo.add(entry)
+        self._patch_entries(set(), [added])
+        return added
 
     def update_entry(self, entry: Entry) -> None:
         self._entries_repo.update(entry)
+        self._patch_entries({entry.id}, [entry])
+
+    def update_entries(self, entries: list[Entry]) -> None:
+        if not entries:
+            return
+        self._entries_repo.update_many(entries)
+        self._patch_entries({e.id for e in entries}, entries)
 
     def delete_entry(self, entry_id: str) -> None:
         """Delete an entry by id.
 
         Raises EntryNotFoundException if the entry does not exist.
         """
-        if not self._entries_repo.delete(entry_id):
+        deleted = self._entries_repo.delete(entry_id)
+        self._patch_entries({entry_id})
+        if not deleted:
             raise EntryNotFoundException(f"Entry {entry_id} not found")
 
     def get_entry(self, entry_id: str) -> Entry:
         return self._entries_repo.get(entry_id)
 
+    def get_entry_by_id_part(self, id_part: str) -> Entry | None:
+        """Return the entry whose id contains `id_part`; None if not unique.
+
+        Always read from MongoDB, never the snapshot: callers delete the entry
+        or modify and write it back, so it must be current and complete.
+        """
+        matches = self._entries_repo.find_by_id_part(id_part, limit=2)
+        return matches[0] if len(matches) == 1 else None
+
     def find_exact_matches(
         self, title: str, *, ignore_case: bool = True
     ) -> list[tuple[int, Entry]]:
-        entries = self.get_entries()
-
-        def str_eq(s1: str, s2: str) -> bool:
-            return s1.lower() == s2.lower() if ignore_case else s1 == s2
-
-        return [(i, e) for i, e in enumerate(entries) if str_eq(title, e.title)]
+        snapshot = self._get_snapshot()
+        if not ignore_case:
+            return [
+                (i, _copy(e))
+                for i, e in enumerate(snapshot.entries)
+                if title == e.title
+            ]
+        needle = title.casefold()
+        return [
+            (i, _copy(snapshot.entries[i]))
+            for i, folded in enumerate(snapshot.titles_casefold)
+            if needle == folded
+        ]
 
     def find_substring_matches(self, title: str) -> list[tuple[int, Entry]]:
-        entries = self.get_entries()
+        snapshot = self._get_snapshot()
+        needle = title.casefold()
         return [
-            (i, e)
-            for i, e in enumerate(entries)
-            if title.lower() in e.title.lower() and title.lower() != e.title.lower()
+            (i, _copy(snapshot.entries[i]))
+            for i, folded in enumerate(snapshot.titles_casefold)
+            if needle in folded and needle != folded
         ]
 
+    def find_entries_by_title(self, substring: str) -> list[Entry]:
+        """Case-insensitive title search, sorted by date; filtered in MongoDB.
+
+        Whole documents are loaded, since the notes take part in the ordering.
+        """
+        return sorted(self._entries_repo.find_by_title_substring(substring))
+
     def find_by_note(self, substring: str) -> list[tuple[int, Entry]]:
-        entries = self.get_entries()
+        entries = self._entries()
+        needle = substring.casefold()
         return [
-            (i, e)
-            for i, e in enumerate(entries)
-            if substring.lower() in e.notes.lower()
+            (i, _copy(e)) for i, e in enumerate(entries) if needle in e.notes.casefold()
         ]
 
     def get_groups(self) -> list[EntryGroup]:
-        return groups_from_list_of_entries(self.get_entries())
+        return groups_from_list_of_entries(self._entries())
+
+    def find_groups(self, title: str | None = None) -> list[EntryGroup]:
+        """Groups whose title contains `title` (case-insensitive), or all groups.
+
+        Unlike `get_groups`, the grouping is done by MongoDB.
+        """
+        return self._entries_repo.get_groups(title)
 
     def get_review_candidates(self) -> list[tuple[EntryGroup, Entry, int]]:
         """Eligible (title, type) groups for retrospective review (see `review_eligible_groups`)."""
-        return review_eligible_groups(self.get_entries())
+        return [
+            (group, _copy(last), idx)
+            for group, last, idx in review_eligible_groups(self._entries())
+        ]
 
     def get_review_stats(self) -> ReviewStats:
         """Aggregate review_rating on last-watched entries per group."""
-        entries = self.get_entries()
+        entries = self._entries()
         groups = partition_by_title_group(entries)
         total = len(groups)
         review_values: list[float] = []
@@ -127,17 +275,17 @@ class EntryService:
         )
 
     def get_random_entries(self, n: int = 1, tag: str | None = None) -> list[Entry]:
-        entries = self.get_entries()
+        entries: Sequence[Entry] = self._entries()
         if tag:
             tag = replace_tag_alias(tag)
             entries = [e for e in entries if tag in e.tags]
         if not entries:
             return []
         n = min(len(entries), n)
-        return random.sample(entries, k=n)
+        return [_copy(e) for e in random.sample(entries, k=n)]
 
     def get_stats(self) -> StatsResult:
-        entries = self.get_entries()
+        entries = self._entries()
         watchlist = self._watchlist_repo.get_all()
         return StatsResult(
             total=len(entries),
@@ -150,7 +298,28 @@ class EntryService:
         )
 
     def get_tags(self) -> defaultdict[str, list[Entry]]:
-        return build_tags(self.get_entries())
+        """Entries by tag; the mapping and the entries are fresh copies.
+
+        An entry with several tags is copied once and shared between its lists.
+        """
+        snapshot = self._get_snapshot()
+        copies = {e.id: _copy(e) for e in snapshot.entries}
+        return defaultdict(
+            list,
+            {
+                tag: [copies[e.id] for e in entries]
+                for tag, entries in snapshot.tags.items()
+            },
+        )
+
+    def get_entries_with_tag(self, tag: str) -> list[Entry] | None:
+        """Copies of the entries carrying `tag`, or None if no entry has it."""
+        entries = self._get_snapshot().tags.get(tag)
+        return None if entries is None else [_copy(e) for e in entries]
+
+    def get_tag_counts(self) -> tuple[tuple[str, int], ...]:
+        """(tag, number of entries) pairs, most used first; cached per snapshot."""
+        return self._get_snapshot().tag_counts
 
     def add_tag(self, entry: Entry, tag_name: str) -> bool:
         """Add tag to entry; returns False if already present."""
@@ -175,28 +344,23 @@ class EntryService:
 
         Returns the modified entries.
         """
-        entries = self.get_entries()
+        # MongoDB narrows by title and tag; the type is compared on the models
+        # since the default type is not stored
+        candidates = self._entries_repo.find_by_title_and_tag(
+            new_entry.title, TAG_WATCH_AGAIN
+        )
         modified: list[Entry] = []
-        for e in entries:
-            if (
-                e.title == new_entry.title
-                and e.type == new_entry.type
-                and TAG_WATCH_AGAIN in e.tags
-                and e.id != new_entry.id
-            ):
+        for e in candidates:
+            if e.type == new_entry.type and e.id != new_entry.id:
                 e.tags.remove(TAG_WATCH_AGAIN)
-                self.update_entry(e)
                 modified.append(e)
+        self.update_entries(modified)
         return modified
 
-    def remove_from_watchlist_on_add(self, entry: Entry) -> bool:
-        """Remove from watchlist after adding to DB. Returns True if removed."""
-        return self._watchlist_repo.delete_by_title(entry.title, entry.is_series)
-
     def entry_by_idx(self, idx: int | str) -> Entry | None:
         """Get entry by sorted-list index. Returns None on invalid index."""
         try:
-            return self.get_entries()[int(idx)]
+            return _copy(self._entries()[int(idx)])
         except (ValueError, IndexError):
             return None
 
@@ -216,5 +380,5 @@ class EntryService:
     def possible_title_match(
         self, title: str, score_threshold: float = 0.65
     ) -> str | None:
-        titles = {e.title for e in self.get_entries()}
+        titles = self._get_snapshot().titles
         return possible_match(title, titles, score_threshold=score_threshold)
@@ -1,20 +1,41 @@
+from time import monotonic
+
 from src.repos.bot_guests import BotGuestsRepo
 
+GUESTS_CACHE_TTL_SEC = 60.0
+
 
 class GuestService:
     """Business logic for bot guest management."""
 
     def __init__(self, guests_repo: BotGuestsRepo) -> None:
         self._guests_repo = guests_repo
+        self._guests_cache: frozenset[str] | None = None
+        self._guests_cache_expires = 0.0
+
+    def _guests(self) -> frozenset[str]:
+        """Guest usernames backed by a short-lived in-memory copy.
+
+        Consulted for every incoming bot message, so the set is only reloaded
+        from MongoDB after `GUESTS_CACHE_TTL_SEC`. The set is never mutated;
+        local writes replace it with a rebuilt one.
+        """
+        if self._guests_cache is None or monotonic() >= self._guests_cache_expires:
+            self._guests_cache = frozenset(self._guests_repo.get_usernames())
+            self._guests_cache_expires = monotonic() + GUESTS_CACHE_TTL_SEC
+        return self._guests_cache
 
     def get_guests(self) -> list[str]:
-        return self._guests_repo.get_usernames()
+        return sorted(self._guests())
 
     def add_guest(self, username: str) -> None:
         self._guests_repo.add_guest(username)
+        self._guests_cache = self._guests() | {username}
 
     def remove_guest(self, username: str) -> bool:
-        return self._guests_repo.remove_guest(username)
+        removed = self._guests_repo.remove_guest(username)
+        self._guests_cache = self._guests() - {username}
+        return removed
 
     def is_guest(self, username: str) -> bool:
-        return username in self.get_guests()
+        return username in self._guests()
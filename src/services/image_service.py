@@ -1,8 +1,15 @@
 """Service layer for S3-backed image management."""
 
+import io
 from typing import Any
 
-from src.obj.image import ImageManager, S3Image
+from src.obj.image import (
+    FOLDER_PATH,
+    UPLOAD_TRANSFER_CONFIG,
+    ImageManager,
+    S3Image,
+    get_new_image_id,
+)
 from src.services.entry_service import EntryService
 
 
@@ -35,6 +42,14 @@ class ImageService:
             bucket_name=self._bucket_name,
         )
 
+    def upload_image_fileobj(self, fileobj: io.IOBase) -> S3Image:
+        """Stream an image from a readable binary file object under a fresh id."""
+        s3_img = S3Image(str(FOLDER_PATH / f"{get_new_image_id()}.png"))
+        self._s3.upload_fileobj(
+            fileobj, self._bucket_name, s3_img.s3_id, Config=UPLOAD_TRANSFER_CONFIG
+        )
+        return s3_img
+
     def generate_presigned_url(
         self, s3_img: S3Image, expires_in_sec: int = 120
     ) -> str:
@@ -1,4 +1,5 @@
 from collections.abc import Callable
+from time import monotonic
 
 from src.exceptions import DuplicateEntryException, EntryNotFoundException
 from src.models.watchlist_entry import WatchlistEntry
@@ -6,6 +7,8 @@ from src.repos.entries import EntriesRepo
 from src.repos.watchlist_entries import WatchlistEntriesRepo
 from src.utils.utils import possible_match
 
+WATCHLIST_CACHE_TTL_SEC = 10.0
+
 
 class WatchlistService:
     """Business logic for the watchlist."""
@@ -17,30 +20,55 @@ class WatchlistService:
     ) -> None:
         self._watchlist_repo = watchlist_repo
         self._entries_repo = entries_repo
+        self._watchlist_cache: tuple[WatchlistEntry, ...] | None = None
+        self._watchlist_cache_expires = 0.0
+
+    def _watchlist(self) -> tuple[WatchlistEntry, ...]:
+        """Watchlist entries backed by a short-lived in-memory copy.
+
+        Writes through this service drop the copy; it is also reloaded after
+        `WATCHLIST_CACHE_TTL_SEC` since other processes may edit the watchlist.
+        """
+        cache = self._watchlist_cache
+        if cache is None or monotonic() >= self._watchlist_cache_expires:
+            cache = tuple(self._watchlist_repo.iter_all())
+            self._watchlist_cache = cache
+            self._watchlist_cache_expires = monotonic() + WATCHLIST_CACHE_TTL_SEC
+        return cache
+
+    def _invalidate_watchlist(self) -> None:
+        self._watchlist_cache = None
 
     def get_items(self) -> list[tuple[str, bool]]:
         """Return (title, is_series) pairs for all watchlist entries."""
-        entries = self._watchlist_repo.get_all()
-        return [(e.title, e.is_series) for e in entries]
+        return [(e.title, e.is_series) for e in self._watchlist()]
 
     def get_entries(self) -> list[WatchlistEntry]:
-        return self._watchlist_repo.get_all()
+        return list(self._watchlist())
 
     @property
     def titles(self) -> set[str]:
-        return {e.title for e in self._watchlist_repo.get_all()}
+        return {e.title for e in self._watchlist()}
 
     @property
     def count(self) -> int:
-        return len(self._watchlist_repo.get_all())
+        return len(self._watchlist())
 
     @property
     def movies(self) -> list[str]:
-        return [e.title for e in self._watchlist_repo.get_all() if not e.is_series]
+        return [e.title for e in self._watchlist() if not e.is_series]
 
     @property
     def series(self) -> list[str]:
-        return [e.title for e in self._watchlist_repo.get_all() if e.is_series]
+        return [e.title for e in self._watchlist() if e.is_series]
+
+    def get_movies_and_series(self) -> tuple[list[str], list[str]]:
+        """Return (movie titles, series titles) from a single watchlist load."""
+        movies: list[str] = []
+        series: list[str] = []
+        for e in self._watchlist():
+            (series if e.is_series else movies).append(e.title)
+        return movies, series
 
     def contains(self, title: str, is_series: bool) -> bool:
         items = self.get_items()
@@ -51,31 +79,36 @@ class WatchlistService:
 
         Raises DuplicateEntryException if already present.
         """
-        if self.contains(title, is_series):
+        entry = self._watchlist_repo.add_by_title_if_absent(title, is_series)
+        self._invalidate_watchlist()
+        if entry is None:
             raise DuplicateEntryException(
                 f"'{title}' is already in the watchlist"
             )
-        return self._watchlist_repo.add_by_title(title, is_series)
+        return entry
 
     def remove(self, title: str, is_series: bool) -> None:
         """Remove from watchlist.
 
         Raises EntryNotFoundException if not present.
         """
-        if not self._watchlist_repo.delete_by_title(title, is_series):
+        if not self.discard(title, is_series):
             raise EntryNotFoundException(
                 f"'{title}' is not in the watchlist"
             )
 
+    def discard(self, title: str, is_series: bool) -> bool:
+        """Remove from watchlist if present. Returns True if removed."""
+        removed = self._watchlist_repo.delete_by_title(title, is_series)
+        self._invalidate_watchlist()
+        return removed
+
     def filter_items(self, key: Callable[[str, bool], bool]) -> list[tuple[str, bool]]:
         return [(t, s) for t, s in self.get_items() if key(t, s)]
 
     def get_is_series(self, title: str) -> bool | None:
         """Return is_series for the given title, or None if not found."""
-        for e in self._watchlist_repo.get_all():
-            if e.title == title:
-                return e.is_series
-        return None
+        return self._watchlist_repo.get_is_series(title)
 
     def possible_title_match(
         self, title: str, score_threshold: float = 0.7
@@ -29,6 +29,7 @@ class Settings(BaseSettings):
     mongodb_suffix: str
     mongodb_prefix: str
     api_users_file: Path = Path("api_users-local.json")
+    entries_cache_ttl_sec: float = 30.0
 
 
 def needs_unlock() -> bool:
@@ -18,14 +18,16 @@ def parse_docstring(docstring: str | None) -> tuple[str, str, str] | None:
     - rest of the docstring"""
     if docstring is None:
         return None
-    lines = docstring.splitlines()
-    if len(lines) < 2:
+    # slice around the first two newlines instead of splitting every line
+    first = docstring.find("\n")
+    if first < 0 or first == len(docstring) - 1:
         warnings.warn(f"Docstring is too short: {docstring!r}")
         return None
-    signature = lines[0]
-    short_desc = lines[1]
-    rest = "\n".join(lines[2:])
-    return signature, short_desc, rest
+    second = docstring.find("\n", first + 1)
+    if second < 0:
+        return docstring[:first], docstring[first + 1 :], ""
+    rest = docstring[second + 1 :]
+    return docstring[:first], docstring[first + 1 : second], rest.removesuffix("\n")
 
 
 def get_rich_help(
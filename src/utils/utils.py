@@ -1,6 +1,7 @@
 import difflib
 import re
 import subprocess
+from collections.abc import Set as AbstractSet
 from datetime import UTC, datetime
 from zoneinfo import ZoneInfo
 
@@ -58,7 +59,7 @@ def different_lines(text1: str, text2: str) -> list[str]:
 
 
 def possible_match(
-    token: str, tokens: set[str], score_threshold: float = 0.6
+    token: str, tokens: AbstractSet[str], score_threshold: float = 0.6
 ) -> str | None:
     """Returns the most similar token to `token`
     from the set of tokens `tokens` given that
@@ -0,0 +1,111 @@
+"""In-memory stand-ins for the MongoDB repositories used by the services."""
+
+from collections.abc import Iterator
+
+import pytest
+from bson import ObjectId
+
+from src.models.entry import Entry
+from src.models.watchlist_entry import WatchlistEntry
+from src.repos.entries import EntriesRepo
+from src.repos.watchlist_entries import WatchlistEntriesRepo
+
+
+class FakeEntriesRepo(EntriesRepo):
+    """Keeps copies of entries in a dict, like documents in a collection."""
+
+    def __init__(self) -> None:
+        self.docs: dict[str, Entry] = {}
+        self.loads = 0
+
+    def add(self, entry: Entry) -> Entry:
+        entry.id = str(ObjectId())
+        self.docs[entry.id] = entry.model_copy(deep=True)
+        return entry
+
+    def get(self, id: str | ObjectId) -> Entry:
+        return self.docs[str(id)].model_copy(deep=True)
+
+    def iter_all(self) -> Iterator[Entry]:
+        self.loads += 1
+        for entry in list(self.docs.values()):
+            yield entry.model_copy(deep=True)
+
+    def update(self, entry: Entry) -> None:
+        self.docs[entry.id] = entry.model_copy(deep=True)
+
+    def update_many(self, entries: list[Entry]) -> None:
+        for entry in entries:
+            self.update(entry)
+
+    def delete(self, id: str | ObjectId) -> bool:
+        return self.docs.pop(str(id), None) is not None
+
+    def find_by_id_part(
+        self,
+        id_part: str,
+        limit: int = 0,
+        projection: dict[str, int] | None = None,
+    ) -> list[Entry]:
+        matches = [
+            e.model_copy(deep=True) for e in self.docs.values() if id_part in e.id
+        ]
+        if projection and projection.get("notes") == 0:
+            for e in matches:
+                e.notes = ""
+        return matches[:limit] if limit else matches
+
+    def find_by_title_substring(self, substring: str) -> list[Entry]:
+        needle = substring.casefold()
+        return [
+            e.model_copy(deep=True)
+            for e in self.docs.values()
+            if needle in e.title.casefold()
+        ]
+
+    def find_by_title_and_tag(self, title: str, tag: str) -> list[Entry]:
+        return [
+            e.model_copy(deep=True)
+            for e in self.docs.values()
+            if e.title == title and tag in e.tags
+        ]
+
+
+class FakeWatchlistRepo(WatchlistEntriesRepo):
+    """Watchlist entries in a list; counts full loads like `FakeEntriesRepo`."""
+
+    def __init__(self) -> None:
+        self.docs: list[WatchlistEntry] = []
+        self.loads = 0
+
+    def iter_all(self) -> Iterator[WatchlistEntry]:
+        self.loads += 1
+        for entry in list(self.docs):
+            yield entry.model_copy()
+
+    def add_by_title_if_absent(
+        self, title: str, is_series: bool
+    ) -> WatchlistEntry | None:
+        if any(e.title == title and e.is_series == is_series for e in self.docs):
+            return None
+        entry = WatchlistEntry(title=title, is_series=is_series)
+        entry.id = str(ObjectId())
+        self.docs.append(entry)
+        return entry.model_copy()
+
+    def delete_by_title(self, title: str, is_series: bool) -> bool:
+        for i, e in enumerate(self.docs):
+            if e.title == title and e.is_series == is_series:
+                del self.docs[i]
+                return True
+        return False
+
+
+@pytest.fixture
+def entries_repo() -> FakeEntriesRepo:
+    return FakeEntriesRepo()
+
+
+@pytest.fixture
+def watchlist_repo() -> FakeWatchlistRepo:
+    return FakeWatchlistRepo()
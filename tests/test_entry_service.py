@@ -0,0 +1,137 @@
+from datetime import UTC, datetime
+
+from src.models.entry import Entry
+from src.services.entry_service import EntryService
+
+
+def _service(entries_repo) -> EntryService:
+    return EntryService(entries_repo, watchlist_repo=None)  # type: ignore[arg-type]
+
+
+def _ids(entries: list[Entry]) -> list[str]:
+    return [e.id for e in entries]
+
+
+def test_latest_entries_match_sorted_tail(entries_repo):
+    svc = _service(entries_repo)
+    for i, (date, notes) in enumerate(
+        [
+            (datetime(2021, 3, 5, tzinfo=UTC), ""),
+            (None, "a long note"),
+            (datetime(2020, 12, 1, tzinfo=UTC), "x"),
+            (None, ""),
+            (datetime(2023, 1, 1, tzinfo=UTC), ""),
+            (None, "mid"),
+            (datetime(2022, 6, 1, tzinfo=UTC), "note"),
+        ]
+    ):
+        svc.add_entry(Entry(title=f"t{i}", rating=5, date=date, notes=notes))
+
+    for n in range(1, 9):
+        expected = sorted(svc.get_entries())[-n:]
+        assert _ids(svc.get_latest_entries(n)) == _ids(expected)
+    assert svc.get_latest_entries(0) == []
+
+
+def test_writes_patch_snapshot_without_reload(entries_repo):
+    svc = _service(entries_repo)
+    old = svc.add_entry(Entry(title="old", rating=5, date=datetime(2020, 1, 1)))
+    new = svc.add_entry(Entry(title="new", rating=6, date=datetime(2022, 1, 1)))
+    assert [e.title for e in svc.get_entries()] == ["old", "new"]
+    assert entries_repo.loads == 1
+
+    mid = svc.add_entry(Entry(title="mid", rating=7, date=datetime(2021, 1, 1)))
+    assert [e.title for e in svc.get_entries()] == ["old", "mid", "new"]
+
+    old.date = datetime(2023, 1, 1, tzinfo=UTC)
+    svc.update_entry(old)
+    assert [e.title for e in svc.get_entries()] == ["mid", "new", "old"]
+
+    svc.delete_entry(mid.id)
+    assert [e.title for e in svc.get_entries()] == ["new", "old"]
+
+    assert entries_repo.loads == 1
+    assert _ids(svc.get_entries()) == _ids(sorted(entries_repo.iter_all()))
+    assert new.id in _ids(svc.get_entries())
+
+
+def test_returned_entries_do_not_alias_snapshot(entries_repo):
+    svc = _service(entries_repo)
+    added = svc.add_entry(Entry(title="a", rating=5, tags={"x"}))
+    added.tags.add("leaked")
+    entry = svc.get_entries()[0]
+    entry.tags.add("y")
+    svc.get_tags()["x"][0].tags.add("z")
+    assert svc.get_entries()[0].tags == {"x"}
+    assert list(svc.get_tags()) == ["x"]
+
+
+def test_load_racing_with_write_is_not_cached(entries_repo):
+    svc = _service(entries_repo)
+    svc.add_entry(Entry(title="a", rating=5))
+    load = entries_repo.iter_all
+
+    def iter_all_with_concurrent_write():
+        entries_repo.iter_all = load
+        snapshot = list(load())
+        svc.add_entry(Entry(title="b", rating=5))
+        yield from snapshot
+
+    entries_repo.iter_all = iter_all_with_concurrent_write
+    assert [e.title for e in svc.get_entries()] == ["a"]
+    assert sorted(e.title for e in svc.get_entries()) == ["a", "b"]
+
+
+def test_entry_by_id_part_requires_unique_match(entries_repo):
+    svc = _service(entries_repo)
+    first = svc.add_entry(Entry(title="a", rating=5))
+    second = svc.add_entry(Entry(title="b", rating=5))
+    shared = next(
+        first.id[i : i + 2]
+        for i in range(len(first.id) - 1)
+        if first.id[i : i + 2] in second.id
+    )
+
+    assert svc.get_entry_by_id_part(shared) is None
+    assert svc.get_entry_by_id_part("zz") is None
+    found = svc.get_entry_by_id_part(first.id)
+    assert found is not None and found.id == first.id
+
+
+def test_add_without_watch_again_matches_keeps_snapshot(entries_repo):
+    svc = _service(entries_repo)
+    svc.add_entry(Entry(title="a", rating=5, tags={"x"}))
+    svc.get_tag_counts()
+    snapshot = svc._snapshot
+
+    assert svc.process_watch_again_on_add(Entry(title="b", rating=5)) == []
+    assert svc._snapshot is snapshot
+    assert "tag_counts" in vars(snapshot)
+    assert entries_repo.loads == 1
+
+
+def test_title_matchers_follow_snapshot_patches(entries_repo):
+    svc = _service(entries_repo)
+    svc.add_entry(Entry(title="Dune", rating=5, date=datetime(2020, 1, 1)))
+    assert [e.title for _, e in svc.find_exact_matches("DUNE")] == ["Dune"]
+
+    svc.add_entry(Entry(title="Dune Part Two", rating=6, date=datetime(2021, 1, 1)))
+    assert [i for i, _ in svc.find_exact_matches("dune")] == [0]
+    assert [(i, e.title) for i, e in svc.find_substring_matches("dune")] == [
+        (1, "Dune Part Two")
+    ]
+    assert svc.find_exact_matches("dune", ignore_case=False) == []
+    assert svc.possible_title_match("Dune Part 2") == "Dune Part Two"
+    assert entries_repo.loads == 1
+
+
+def test_entry_by_id_part_can_be_written_back(entries_repo):
+    svc = _service(entries_repo)
+    added = svc.add_entry(Entry(title="a", rating=5, notes="keep me"))
+
+    entry = svc.get_entry_by_id_part(added.id[-6:])
+    assert entry is not None
+    svc.add_tag(entry, "x")
+
+    assert entries_repo.get(added.id).notes == "keep me"
+    assert svc.get_entries()[0].notes == "keep me"
@@ -0,0 +1,26 @@
+from src.applications.bot.formatting import chunk_lines
+
+
+def test_chunk_lines_packs_lines_up_to_limit():
+    assert list(chunk_lines(["aa", "bb", "cc"], limit=5)) == ["aa\nbb", "cc"]
+    assert list(chunk_lines(["aa", "bb"], limit=100)) == ["aa\nbb"]
+
+
+def test_chunk_lines_splits_only_overlong_lines():
+    assert list(chunk_lines(["x", "abcdefg", "y"], limit=3)) == [
+        "x",
+        "abc",
+        "def",
+        "g\ny",
+    ]
+
+
+def test_chunk_lines_respects_limit_and_keeps_text():
+    lines = [f"line {i}" * (i % 5 + 1) for i in range(200)]
+    chunks = list(chunk_lines(lines, limit=64))
+    assert all(len(chunk) <= 64 for chunk in chunks)
+    assert "".join(chunks).replace("\n", "") == "".join(lines)
+
+
+def test_chunk_lines_empty():
+    assert list(chunk_lines([])) == []
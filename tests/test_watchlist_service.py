@@ -0,0 +1,38 @@
+import pytest
+
+from src.exceptions import DuplicateEntryException, EntryNotFoundException
+from src.services.watchlist_service import WatchlistService
+
+
+@pytest.fixture
+def svc(watchlist_repo) -> WatchlistService:
+    return WatchlistService(watchlist_repo, entries_repo=None)  # type: ignore[arg-type]
+
+
+def test_add_rejects_duplicates(svc):
+    svc.add("Dune", False)
+    svc.add("Dune", True)
+    with pytest.raises(DuplicateEntryException):
+        svc.add("Dune", False)
+    assert svc.get_movies_and_series() == (["Dune"], ["Dune"])
+
+
+def test_discard_and_remove(svc):
+    svc.add("Dark", True)
+    assert svc.discard("Dark", False) is False
+    assert svc.discard("Dark", True) is True
+    assert svc.discard("Dark", True) is False
+    with pytest.raises(EntryNotFoundException):
+        svc.remove("Dark", True)
+    assert svc.get_items() == []
+
+
+def test_reads_are_cached_until_a_write(svc, watchlist_repo):
+    svc.add("Heat", False)
+    assert svc.titles == {"Heat"}
+    assert svc.count == 1
+    assert watchlist_repo.loads == 1
+
+    svc.discard("Heat", False)
+    assert svc.titles == set()
+    assert watchlist_repo.loads == 2